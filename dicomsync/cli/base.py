@@ -1,9 +1,9 @@
 """Shared objects for CLI and basic CLI commands"""
+import importlib
 import logging
 import os
-from dataclasses import dataclass
-from functools import wraps
 from pathlib import Path
+from typing import TYPE_CHECKING, Optional
 
 import click
 from click import UsageError
@@ -14,7 +14,10 @@ from dicomsync.exceptions import (
     PasswordNotFoundError,
 )
 from dicomsync.logs import get_module_logger, install_colouredlogs
-from dicomsync.persistence import DicomSyncSettings, DicomSyncSettingsFromFile
+
+if TYPE_CHECKING:
+    # importing persistence pulls in pydantic and all place models. Defer to first use
+    from dicomsync.persistence import DicomSyncSettings
 
 logger = get_module_logger("dicomsync")
 
@@ -27,24 +30,29 @@ def configure_logging(verbose):
         loglevel = logging.DEBUG
 
     install_colouredlogs(level=loglevel)
-    logging.debug(
-        f"Set loglevel "
-        f"to {logging.getLevelName(logging.getLogger().getEffectiveLevel())}"
-    )
+    logging.debug("Set loglevel to %s", logging.getLevelName(loglevel))
 
 
-@dataclass
 class DicomSyncContext:
-    current_dir: Path
+    """Passed to each CLI command. Holds state for a single CLI invocation"""
+
+    __slots__ = ("current_dir", "_settings")
+
+    def __init__(self, current_dir: Path):
+        self.current_dir = current_dir
+        self._settings: Optional["DicomSyncSettings"] = None
 
     def load_settings(self):
-        """Load settings from current dir
+        """Load settings from current dir. Settings are read from disk on first call
+        only. Subsequent calls return the same settings object
 
         Raises
         ------
         click.UsageError
         """
-        return load_settings(folder=self.current_dir)
+        if self._settings is None:
+            self._settings = load_settings(folder=self.current_dir)
+        return self._settings
 
 
 def get_context() -> DicomSyncContext:
@@ -62,27 +70,49 @@ def load_settings(folder):
     ------
     click.UsageError
     """
+    from dicomsync.persistence import DicomSyncSettingsFromFile
+
     settings_path = DicomSyncSettingsFromFile.get_default_file(folder)
-    logger.debug(f"Reading settings from {settings_path}")
+    logger.debug("Reading settings from %s", settings_path)
     try:
         return DicomSyncSettingsFromFile.init_from_file(settings_path)
     except NoSettingsFoundError as e:
-        logger.warning(str(e))
+        # expected when running outside a settings dir. UsageError shows message
+        logger.debug("No settings: %s", e)
         raise UsageError(str(e)) from e
 
 
-def handle_dicomsync_exceptions(func):
-    """Decorator for handling dicomsync exceptions more usefully than just raising"""
+class DicomSyncGroup(click.Group):
+    """Click group that handles dicomsync exceptions more usefully than just raising.
+
+    Handling is done once around the whole command invocation instead of wrapping
+    each command separately.
+
+    Subcommands can be given as lazy_subcommands {name: 'module.attribute'}. These
+    are imported when that subcommand is run, so running one subcommand does not
+    import the others. Note that '--help' on the group imports all of them to show
+    their short help
+    """
 
-    @wraps(func)
-    def with_handling(*args, **kwargs):
+    def __init__(self, *args, lazy_subcommands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx):
+        return sorted(super().list_commands(ctx) + list(self.lazy_subcommands))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_subcommands:
+            module_name, attribute = self.lazy_subcommands[cmd_name].rsplit(".", 1)
+            return getattr(importlib.import_module(module_name), attribute)
+        return super().get_command(ctx, cmd_name)
+
+    def invoke(self, ctx):
         try:
-            func(*args, **kwargs)
+            return super().invoke(ctx)
         except PasswordNotFoundError as e:
             logger.error(e)
-            raise click.UsageError(e) from e
-
-    return with_handling
+            raise click.UsageError(str(e)) from e
 
 
 def dicom_sync_command(**kwargs):
@@ -91,20 +121,17 @@ def dicom_sync_command(**kwargs):
 
     @click.command(**kwargs)
     @click.pass_obj
-    @handle_dicomsync_exceptions
 
     Just to prevent duplicated code
     """
 
     def decorated(func):
-        return click.command(**kwargs)(
-            click.pass_obj(handle_dicomsync_exceptions(func))
-        )
+        return click.command(**kwargs)(click.pass_obj(func))
 
     return decorated
 
 
-def get_key_for_place(place, settings: DicomSyncSettings):
+def get_key_for_place(place, settings: "DicomSyncSettings"):
     """Find the key that the given place is stored under
 
     Returns
@@ -120,14 +147,21 @@ def get_key_for_place(place, settings: DicomSyncSettings):
     Notes
     -----
     Will return the first matching place object in settings. If for any reason a place
-    is present twice in settings, only the first one will be returned
+    is present twice in settings, only the first one will be returned.
+    Places are usually taken from the same settings object, so identity is checked
+    before falling back to (slower) comparison of serialized values
 
     """
     for key, place_found in settings.places.items():
-        if place.dict() == place_found.dict():
+        if place_found is place:
+            return key
+
+    place_dict = place.model_dump()
+    for key, place_found in settings.places.items():
+        if place_found.model_dump() == place_dict:
             return key
 
     raise DICOMSyncError(
         f"Place not found in settings. Looked for {place} in "
-        f"{list(settings.places.keys())} but found no match"
+        f"{settings.place_keys()} but found no match"
     )
@@ -1,4 +1,6 @@
 """Custom click parameter types"""
+import re
+
 from click import ParamType
 
 from dicomsync.cli.base import DicomSyncContext
@@ -26,16 +28,12 @@ def get_place_key(value, ctx):
     if not value:
         return None  # is default value if parameter not given
 
-    if type(value) is not str:
+    if not isinstance(value, str):
         raise PlaceKeyParamError(
             f"Expected string input but found {type(value)} " f"value:'{value}'"
         )
-    if not isinstance(ctx.obj, DicomSyncContext):
-        raise PlaceKeyParamError(
-            f"Place Key parameter needs a DicomSyncContext to "
-            f"be passed. Found context of type'{type(ctx.obj)}'"
-        )
 
+    # ctx.obj is always set to a DicomSyncContext by the main entrypoint
     context: DicomSyncContext = ctx.obj
     settings = context.load_settings()
     try:
@@ -43,7 +41,7 @@ def get_place_key(value, ctx):
     except KeyError as e:
         raise PlaceKeyParamError(
             f"Could not find '{value}' in places. Choose from "
-            f"'{list(settings.places.keys())}'"
+            f"'{settings.place_keys()}'"
         ) from e
 
 
@@ -77,6 +75,9 @@ class ImagingStudyParameterType(ParamType):
 
     name = "imaging_study_key"
 
+    # <Place>:<patient>/<Key>. Checked before parsing so malformed input fails fast
+    study_key_format = re.compile(r"[^:]+:[^:/]+/[^:/]+")
+
     def convert(self, value, param, ctx):
         """Try to parse <Place>:<patient>/<Key>, check whether place exists.
 
@@ -90,6 +91,11 @@ class ImagingStudyParameterType(ParamType):
         if not value:
             return None  # is default value if parameter not given
 
+        if not self.study_key_format.fullmatch(value):
+            self.fail(
+                message=f"Expected format '<place>:<patient>/<study>' but "
+                f"found '{value}'"
+            )
         try:
             identifier = ImagingStudyIdentifier.init_from_string(value)
         except DICOMSyncError as e:
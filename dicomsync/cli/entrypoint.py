@@ -1,15 +1,24 @@
 """Entrypoint for dicomsync CLI command. All subcommands are connected here."""
 import click
 
-from dicomsync.cli.base import DicomSyncContext, configure_logging, get_context
-from dicomsync.cli.place import place
-from dicomsync.cli.send import cli_send
+from dicomsync.cli.base import (
+    DicomSyncContext,
+    DicomSyncGroup,
+    configure_logging,
+    get_context,
+)
 from dicomsync.logs import get_module_logger
 
 logger = get_module_logger("entrypoint")
 
 
-@click.group()
+@click.group(
+    cls=DicomSyncGroup,
+    lazy_subcommands={
+        "place": "dicomsync.cli.place.place",
+        "send": "dicomsync.cli.send.cli_send",
+    },
+)
 @click.option("-v", "--verbose", count=True)
 @click.pass_context
 def main(ctx, verbose):
@@ -31,10 +40,8 @@ def status(context: DicomSyncContext):
     else:
         click.echo("Reading settings from memory")
 
-    place_keys = list(settings.places.keys())
+    place_keys = settings.place_keys()
     click.echo(f"{len(place_keys)} places defined in settings: {place_keys}")
 
 
 main.add_command(status)
-main.add_command(place)
-main.add_command(cli_send)
@@ -1,6 +1,5 @@
 import click
 from click import BadParameter
-from tabulate import tabulate
 
 from dicomsync.cli.base import DicomSyncContext, dicom_sync_command
 from dicomsync.cli.click_parameter_types import PlaceKeyParameterType
@@ -22,6 +21,8 @@ def place(context: DicomSyncContext):
 @click.pass_obj
 def cli_list(context: DicomSyncContext):
     """Show all places"""
+    from tabulate import tabulate  # only needed here. Keep other commands fast
+
     table = []
     for key, place in context.load_settings().places.items():
         table.append({"key": key, "place": str(place)})
@@ -33,7 +34,7 @@ def cli_list(context: DicomSyncContext):
 def cli_init(context: DicomSyncContext):
     """Write empty settings file in current dir"""
     settings_path = DicomSyncSettingsFromFile.get_default_file(context.current_dir)
-    logger.debug(f'Writing empty settings to "{settings_path}"')
+    logger.debug('Writing empty settings to "%s"', settings_path)
     click.echo("Writing empty settings file to current dir")
     DicomSyncSettingsFromFile(path=settings_path, places={}).save()
 
@@ -49,7 +50,7 @@ def cli_remove(context: DicomSyncContext, key):
         settings.save()
     except KeyError as e:
         raise BadParameter(f"place '{key}' does not exist") from e
-    logger.info(f'removed place "{key}"')
+    logger.info('removed place "%s"', key)
 
 
 @click.group()
@@ -66,7 +67,7 @@ def add_dicom_root_folder(context: DicomSyncContext, path_in, key):
     """Add folder containing patient/study folders"""
     settings = context.load_settings()
     dicom_root_folder = DICOMRootFolder(path=path_in)
-    logger.debug(f"Adding {dicom_root_folder}")
+    logger.debug("Adding %s", dicom_root_folder)
     places = settings.places
     if key in places:
         raise BadParameter(f"{key} already exists")
@@ -74,7 +75,7 @@ def add_dicom_root_folder(context: DicomSyncContext, path_in, key):
         settings.places[key] = dicom_root_folder
         settings.save()
 
-    logger.info(f"added {dicom_root_folder} as '{key}'")
+    logger.info("added %s as '%s'", dicom_root_folder, key)
 
 
 @click.command(short_help="add ZippedDICOMRootFolder", name="zipped_root")
@@ -85,7 +86,7 @@ def add_zipped_dicom_root_folder(context: DicomSyncContext, path_in, key):
     """Add folder containing patient/zip studies"""
     settings = context.load_settings()
     folder = ZippedDICOMRootFolder(path=path_in)
-    logger.debug(f"Adding {folder}")
+    logger.debug("Adding %s", folder)
     places = settings.places
     if key in places:
         raise BadParameter(f"{key} already exists")
@@ -93,7 +94,7 @@ def add_zipped_dicom_root_folder(context: DicomSyncContext, path_in, key):
         settings.places[key] = folder
         settings.save()
 
-    logger.info(f"added {folder} as '{key}'")
+    logger.info("added %s as '%s'", folder, key)
 
 
 @click.command(short_help="add ZippedDICOMRootFolder", name="xnat_pre_archive")
@@ -108,7 +109,7 @@ def add_xnat_pre_archive(context: DicomSyncContext, key, server, project, user):
     pre_archive = SerializableXNATProjectPreArchive(
         server=server, project=project, user=user
     )
-    logger.debug(f"Adding {pre_archive}")
+    logger.debug("Adding %s", pre_archive)
     places = settings.places
     if key in places:
         raise BadParameter(f"{key} already exists")
@@ -116,18 +117,21 @@ def add_xnat_pre_archive(context: DicomSyncContext, key, server, project, user):
         settings.places[key] = pre_archive
         settings.save()
 
-    logger.info(f"added {pre_archive} as '{key}'")
+    logger.info("added %s as '%s'", pre_archive, key)
 
 
 @dicom_sync_command()
 @click.argument("place", type=PlaceKeyParameterType())
 def ls(context: DicomSyncContext, place):
     """List studies in a place"""
-    all = place.all_studies()
-    patients = {str(x.subject) for x in all}
-    click.echo(f"Found {len(all)} studies over {len(patients)} patients in {place}")
+    count = 0
+    patients = set()
+    for study in place.all_studies():  # single pass, echo each study as found
+        count += 1
+        patients.add(study.subject)
+        click.echo(study.key())
     click.echo("-----------------------------------")
-    click.echo("\n".join([x.key() for x in place.all_studies()]))
+    click.echo(f"Found {count} studies over {len(patients)} patients in {place}")
 
 
 place.add_command(cli_list)
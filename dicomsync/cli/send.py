@@ -8,7 +8,6 @@ from dicomsync.cli.click_parameter_types import (
     PlaceKeyParameterType,
 )
 from dicomsync.core import ImagingStudyIdentifier, Place
-from dicomsync.exceptions import StudyNotFoundError
 from dicomsync.logs import get_module_logger
 from dicomsync.routing import SwitchBoard
 
@@ -29,19 +28,20 @@ def cli_send(
 ):
     """Send a single imaging study (format 'place/study') to a place."""
     source_place, source_study_identifier = study
-    try:
-        source_study = source_place.get_study(source_study_identifier.as_study_key())
-    except StudyNotFoundError:
-        slug = source_study_identifier.to_slug()
-        logger.debug(
-            f'Study "{source_study_identifier}" not found. Trying slug "{slug}"'
-        )
-        source_study = source_place.get_study(slug.as_study_key())
+    # original data might not use slugs. Try both the key as given and its slug
+    source_study = source_place.get_study_any(
+        [
+            source_study_identifier.as_study_key(),
+            source_study_identifier.to_slug().as_study_key(),
+        ]
+    )
 
     settings = context.load_settings()
     board = SwitchBoard()
     logger.info(
-        f"copying '{get_key_for_place(source_place, settings)}/{source_study}' "
-        f"to '{get_key_for_place(place, settings)}'"
+        "copying '%s/%s' to '%s'",
+        get_key_for_place(source_place, settings),
+        source_study,
+        get_key_for_place(place, settings),
     )
     board.send(study=source_study, place=place, dry_run=dry_run)
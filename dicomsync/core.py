@@ -1,16 +1,25 @@
+import re
 from dataclasses import dataclass
 from enum import Enum
-from typing import Iterable
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional
 
 from pydantic import BaseModel
 from slugify import slugify
 
-from dicomsync.exceptions import DICOMSyncError
+from dicomsync.exceptions import DICOMSyncError, StudyNotFoundError
 
 
+# Plain ascii strings can be slugified without the full unicode pipeline of slugify
+_SIMPLE_ASCII = re.compile(r"[A-Za-z0-9 ._-]+")
+_NON_SLUG_CHARS = re.compile(r"[^a-z0-9]+")
+
+
+@lru_cache(maxsize=131072)
 def make_slug(string_in: str) -> str:
     """Make sure the string is a valid slug, usable in a URL or path.
-     Uses underscore seperator.
+     Uses underscore seperator. Cached, as the same patient names are slugified
+     for many studies.
 
     Returns
     -------
@@ -21,23 +30,34 @@ def make_slug(string_in: str) -> str:
     ValueError
         If string_in is not a valid slug
     """
+    if _SIMPLE_ASCII.fullmatch(string_in):  # same result as slugify, but faster
+        return _NON_SLUG_CHARS.sub("_", string_in.lower()).strip("_")
     response: str = slugify(string_in, separator="_", lowercase=True)
 
     return response
 
 
-@dataclass
+@dataclass(frozen=True)
 class Subject:
-    """A person of whom images can be taken. Name is a unique identifier"""
+    """A person of whom images can be taken. Name is a unique identifier
+
+    Immutable and hashable, so subjects can be used in sets and as dict keys
+    """
+
+    __slots__ = ("name",)  # dataclass(slots=True) requires python 3.10
 
-    def __init__(self, name):
-        self.name = name
+    name: str
 
     def __str__(self):
         return f"{self.name}"
 
-    def __eq__(self, other):
-        return self.name == other.name
+    # same as dataclass(slots=True) would add. Default unpickling and copy use
+    # setattr, which frozen does not allow
+    def __getstate__(self):
+        return [self.name]
+
+    def __setstate__(self, state):
+        object.__setattr__(self, "name", state[0])
 
 
 class ImagingStudy:
@@ -46,9 +66,12 @@ class ImagingStudy:
     This could be a CT scan, an X-ray, and MRI scan.
     """
 
+    __slots__ = ("subject", "description", "_key")  # many studies per scan
+
     def __init__(self, subject: Subject, description: str):
         self.subject = subject
         self.description = description
+        self._key: Optional[str] = None
 
     def key(self) -> str:
         """Unique identifier. This is used to check whether an imaging study exists
@@ -57,6 +80,8 @@ class ImagingStudy:
         Notes
         -----
         Lower case keys are expected but not enforced.
+        Key is computed on first call only. Subject and description are not
+        expected to change after that
 
         Returns
         -------
@@ -64,7 +89,9 @@ class ImagingStudy:
             Unique identifier for this study.
 
         """
-        return make_slug(self.subject.name) + "/" + make_slug(self.description)
+        if self._key is None:
+            self._key = make_slug(self.subject.name) + "/" + make_slug(self.description)
+        return self._key
 
 
 class ImagingStudyIdentifier:
@@ -76,6 +103,8 @@ class ImagingStudyIdentifier:
     PLACE_SEPERATOR = ":"
     STUDY_SEPARATOR = "/"
 
+    __slots__ = ("place_name", "patient", "study_key")
+
     def __init__(self, place_name: str, patient: Subject, study_key: str):
         self.place_name = place_name
         self.patient = patient
@@ -89,14 +118,25 @@ class ImagingStudyIdentifier:
 
     @classmethod
     def init_from_string(cls, string_in):
-        try:
-            place_name, rest = string_in.split(cls.PLACE_SEPERATOR)
-            patient_name, study_key = rest.split(cls.STUDY_SEPARATOR)
-        except ValueError as e:
+        """Parse '<place>:<patient>/<study>'. Place may contain '/', patient and
+        study may not contain either separator
+
+        Raises
+        ------
+        DICOMSyncError
+            If string_in is not in the expected format
+        """
+        place_name, place_sep, rest = string_in.partition(cls.PLACE_SEPERATOR)
+        patient_name, study_sep, study_key = rest.partition(cls.STUDY_SEPARATOR)
+        if (
+            not (place_sep and study_sep)
+            or cls.PLACE_SEPERATOR in rest
+            or cls.STUDY_SEPARATOR in study_key
+        ):
             raise DICOMSyncError(
                 f"Expected format '<place>{cls.PLACE_SEPERATOR}"
                 f"<patient>{cls.STUDY_SEPARATOR}<study>'"
-            ) from e
+            )
         return cls(
             place_name=place_name,
             patient=Subject(name=patient_name),
@@ -124,6 +164,14 @@ class ImagingStudyIdentifier:
 class Place(BaseModel):
     """Can contain imaging studies"""
 
+    def __eq__(self, other):
+        """Equal if fields are equal. Private attributes only hold caches and
+        should not affect equality
+        """
+        if type(self) is not type(other):
+            return NotImplemented
+        return self.model_dump() == other.model_dump()
+
     def contains(self, study: ImagingStudy) -> bool:
         """Return true if this place contains this ImagingStudy"""
         raise NotImplementedError()
@@ -138,6 +186,24 @@ class Place(BaseModel):
         """
         raise NotImplementedError()
 
+    def get_study_any(self, keys: List[str]) -> ImagingStudy:
+        """Return the imaging study for the first of keys that is in this place.
+        Lists studies in this place only once, instead of calling get_study() for
+        each key
+
+        Raises
+        ------
+        StudyNotFoundError
+            If none of the keys is there
+        """
+        studies: Dict[str, ImagingStudy] = {}
+        for study in self.all_studies():
+            studies.setdefault(study.key(), study)  # first wins, like get_study()
+        for key in keys:
+            if key in studies:
+                return studies[key]
+        raise StudyNotFoundError(f"Study not found in {self}. Tried keys {keys}")
+
     def all_studies(self) -> Iterable[ImagingStudy]:
         raise NotImplementedError()
 
@@ -1,7 +1,10 @@
 """Handling imaging studies on local disks"""
+import os
 import shutil
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Literal, Union
+from typing import Iterator, List, Literal, Optional, Sequence, Set, Union
 
 from dicomsync.core import (
     AssertionResult,
@@ -20,24 +23,127 @@ from dicomsync.logs import get_module_logger
 logger = get_module_logger("local")
 
 
+def _iter_entries(path: Union[Path, str]) -> Iterator["os.DirEntry[str]"]:
+    """Yield all entries directly under path. Like Path.glob("*"), yields nothing if
+    path does not exist, is not a folder or cannot be read
+
+    Uses os.scandir, which gets entry types from the directory listing itself,
+    avoiding a separate stat() call for each entry
+    """
+    try:
+        with os.scandir(path) as entries:
+            yield from entries
+    except (FileNotFoundError, NotADirectoryError, PermissionError):
+        return
+
+
+def _iter_subfolders(path: Union[Path, str]) -> Iterator["os.DirEntry[str]"]:
+    """Yield all folders directly under path. See _iter_entries()"""
+    return (x for x in _iter_entries(path) if x.is_dir())
+
+
 class DICOMStudyFolder(ImagingStudy):
     """A local folder containing all the DICOM files for a single imaging study
 
     description and subject need to be valid_slugs
     """
 
+    __slots__ = ("path",)
+
     def __init__(self, subject: Subject, description: str, path: Union[Path, str]):
         super().__init__(subject, description)
         self.path = Path(path)
 
-    def all_files(self):
-        return [x for x in self.path.glob("*") if x.is_file()]
+    def all_files(self) -> List[Path]:
+        """All files directly in this folder. Empty if folder cannot be listed"""
+        return [Path(x.path) for x in _iter_entries(self.path) if x.is_file()]
 
     def __str__(self):
         return f"{self.subject.name} - {self.description}: {self.path}"
 
 
-class DICOMRootFolder(Place):
+class _RootFolder(Place):
+    """Shared lookup and caching for local folders with a patient/study structure.
+
+    Subclasses implement _scan_studies() and _get_study_at()
+    """
+
+    # studies found on first scan of path. Reset when a study is sent here
+    _studies: Optional[Sequence[ImagingStudy]] = None
+    _study_keys: Optional[Set[str]] = None  # keys of _studies, for fast contains()
+
+    def contains(self, study: ImagingStudy) -> bool:
+        """Return true if this place contains this ImagingStudy"""
+        if self._study_keys is None:
+            self._study_keys = {x.key() for x in self.all_studies()}
+        return study.key() in self._study_keys
+
+    def get_study(self, key: str) -> ImagingStudy:
+        """Return the imaging study corresponding to key
+
+        Raises
+        ------
+        StudyNotFoundError
+            If study for key is not there
+        """
+        study = self._get_study_from_path(key) or next(
+            (x for x in self.all_studies() if x.key() == key), None
+        )
+        if not study:
+            raise StudyNotFoundError(f"Study '{key}' not found in {self}")
+        return study
+
+    def get_study_any(self, keys: List[str]) -> ImagingStudy:
+        """Return the imaging study for the first of keys that is in this place
+
+        Raises
+        ------
+        StudyNotFoundError
+            If none of the keys is there
+        """
+        for key in keys:
+            study = self._get_study_from_path(key)
+            if study:
+                return study
+        return super().get_study_any(keys)
+
+    def _get_study_from_path(self, key: str) -> Optional[ImagingStudy]:
+        """Fast path for get_study(). If patient and study names on disk are slugs
+        already, key maps directly to a path and no scan is needed.
+
+        Returns
+        -------
+        ImagingStudy
+            If study for key exists
+        None
+            If not found this way
+        """
+        patient, _, description = key.partition("/")
+        if not patient or not description or "/" in description:
+            return None  # would resolve to patient folder or deeper. Not a study
+        study = self._get_study_at(patient, description)
+        return study if study and study.key() == key else None
+
+    def _get_study_at(self, patient: str, description: str) -> Optional[ImagingStudy]:
+        """The study stored for exactly this patient and description, if any"""
+        raise NotImplementedError()
+
+    def all_studies(self) -> List[ImagingStudy]:
+        """All studies in this folder. Folder is scanned on first call only"""
+        if self._studies is None:
+            self._studies = self._scan_studies()
+        return list(self._studies)
+
+    def _scan_studies(self) -> Sequence[ImagingStudy]:
+        raise NotImplementedError()
+
+    def _clear_cache(self):
+        """Call when studies have been added. Next call will scan again"""
+        self._studies = None
+        self._study_keys = None
+
+
+class DICOMRootFolder(_RootFolder):
     """A folder with patient/study structure.
 
     Each subfolder represents a patient. In each patient folder there is a folder
@@ -58,32 +164,25 @@ class DICOMRootFolder(Place):
     def __str__(self):
         return f"Root folder at '{self.path}'"
 
-    def contains(self, study: ImagingStudy) -> bool:
-        """Return true if this place contains this ImagingStudy"""
-        return study.key() in (x.key() for x in self.all_studies())
-
-    def get_study(self, key: str) -> ImagingStudy:
-        """Return the imaging study corresponding to key
-
-        Raises
-        ------
-        StudyNotFoundError
-            If study for key is not there
-        """
-        study = next((x for x in self.all_studies() if x.key() == key), None)
-        if not study:
-            raise StudyNotFoundError(f"Study '{key}' not found in {self}")
-        return study
-
-    def all_studies(self) -> List[DICOMStudyFolder]:
+    def _get_study_at(
+        self, patient: str, description: str
+    ) -> Optional[DICOMStudyFolder]:
+        path = self.path / patient / description
+        if not path.is_dir():
+            return None
+        return DICOMStudyFolder(
+            subject=Subject(patient), description=description, path=path
+        )
+
+    def _scan_studies(self) -> List[DICOMStudyFolder]:
         studies = []
-        for folder in [x for x in self.path.glob("*") if x.is_dir()]:
-            for subfolder in [x for x in folder.glob("*") if x.is_dir()]:
+        for folder in _iter_subfolders(self.path):
+            for subfolder in _iter_subfolders(folder.path):
                 studies.append(
                     DICOMStudyFolder(
                         subject=Subject(folder.name),
                         description=subfolder.name,
-                        path=subfolder,
+                        path=subfolder.path,
                     )
                 )
 
@@ -105,12 +204,19 @@ class DICOMRootFolder(Place):
                 raise StudyAlreadyExistsError(f"{study_path} exists and is not empty")
 
         study_path.mkdir(exist_ok=True, parents=True)
-        count = 0
-        for file in folder.all_files():
-            count += 1
-            shutil.copyfile(file, study_path / file.name)
+        self._clear_cache()
+        files = folder.all_files()
+        destination = str(study_path)  # os.path.join is cheaper than Path per file
+        # copyfile spends most time waiting on disk or network. Overlap copies
+        with ThreadPoolExecutor() as executor:
+            list(
+                executor.map(
+                    lambda x: shutil.copyfile(x, os.path.join(destination, x.name)),
+                    files,
+                )
+            )
 
-        logger.debug(f"copied {count} files to {self}")
+        logger.debug(f"copied {len(files)} files to {self}")
 
 
 class ZippedDICOMStudy(ImagingStudy):
@@ -119,6 +225,8 @@ class ZippedDICOMStudy(ImagingStudy):
     description and subject need to be valid slugs
     """
 
+    __slots__ = ("path",)
+
     def __init__(self, subject: Subject, description: str, path: Union[Path, str]):
         super().__init__(subject, description)
         self.path = Path(path)
@@ -127,7 +235,7 @@ class ZippedDICOMStudy(ImagingStudy):
         return f"ZippedDICOMStudy {self.subject.name} - {self.description}: {self.path}"
 
 
-class ZippedDICOMRootFolder(Place):
+class ZippedDICOMRootFolder(_RootFolder):
     """A folder patient/study.zip structure.
 
     Each subfolder represents a patient. In each patient folder there is a zipfile
@@ -153,34 +261,28 @@ class ZippedDICOMRootFolder(Place):
     def __str__(self):
         return f"Zipped DICOM Root folder at '{self.path}'"
 
-    def contains(self, study: ImagingStudy) -> bool:
-        """Return true if this place contains this ImagingStudy"""
-        return study.key() in (x.key() for x in self.all_studies())
-
-    def get_study(self, key: str) -> ImagingStudy:
-        """Return the imaging study corresponding to key
-
-        Raises
-        ------
-        StudyNotFoundError
-            If study for key is not there
-        """
-        study = next((x for x in self.all_studies() if x.key() == key), None)
-        if not study:
-            raise StudyNotFoundError(f"Study '{key}' not found in {self}")
-        return study
-
-    def all_studies(self) -> List[ZippedDICOMStudy]:
+    def _get_study_at(
+        self, patient: str, description: str
+    ) -> Optional[ZippedDICOMStudy]:
+        path = self.path / patient / f"{description}.zip"
+        if not path.is_file():
+            return None
+        return ZippedDICOMStudy(
+            subject=Subject(patient), description=description, path=path
+        )
+
+    def _scan_studies(self) -> List[ZippedDICOMStudy]:
         studies = []
-        for folder in [x for x in self.path.glob("*") if x.is_dir()]:
-            for zipfile in [x for x in folder.glob("*.zip") if x.is_file()]:
-                studies.append(
-                    ZippedDICOMStudy(
-                        subject=Subject(folder.name),
-                        description=zipfile.stem,  # remove .zip extension
-                        path=zipfile,
+        for folder in _iter_subfolders(self.path):
+            for entry in _iter_entries(folder.path):
+                if entry.name.endswith(".zip") and entry.is_file():
+                    studies.append(
+                        ZippedDICOMStudy(
+                            subject=Subject(folder.name),
+                            description=entry.name[: -len(".zip")],
+                            path=entry.path,
+                        )
                     )
-                )
 
         return studies
 
@@ -201,9 +303,24 @@ class ZippedDICOMRootFolder(Place):
         logger.debug(f"Zipping {folder} to {self}")
 
         zip_path.parent.mkdir(exist_ok=True, parents=True)
+        self._clear_cache()
         logger.info(f"Creating zip archive for {folder.path} in {zip_path}")
-        # Removing suffix here to stop make_archive from adding another '.zip'
-        shutil.make_archive(zip_path.with_suffix(""), "zip", folder.path)
+        # DICOM pixel data is often compressed already. Store, don't deflate
+        temp_path = zip_path.with_name(zip_path.name + ".tmp")
+        try:
+            with zipfile.ZipFile(
+                temp_path, "w", compression=zipfile.ZIP_STORED, allowZip64=True
+            ) as zip_file:
+                for root, _, file_names in os.walk(folder.path):
+                    for file_name in file_names:
+                        file_path = os.path.join(root, file_name)
+                        zip_file.write(
+                            file_path, arcname=os.path.relpath(file_path, folder.path)
+                        )
+        except BaseException:
+            temp_path.unlink(missing_ok=True)  # no half-written zips on failure
+            raise
+        os.replace(temp_path, zip_path)
         logger.debug("done")
 
     def assert_has_zip(self, folder: DICOMStudyFolder) -> AssertionResult:
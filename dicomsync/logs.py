@@ -1,7 +1,5 @@
 import logging
 
-import coloredlogs
-
 ROOT_LOGGER_NAME = "dicomsync"
 
 LOG_FORMAT = "%(asctime)s %(name)s %(levelname)s: %(message)s"
@@ -13,4 +11,6 @@ def get_module_logger(name):
 
 def install_colouredlogs(level):
     """Use coloured logs"""
+    import coloredlogs  # imported here to keep it out of module import time
+
     coloredlogs.install(level=level, fmt=LOG_FORMAT)
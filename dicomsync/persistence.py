@@ -1,8 +1,10 @@
 """Functions and classes for handling settings and sensitive data."""
+import os
+import sys
 from pathlib import Path
-from typing import Dict, Union
+from typing import Dict, List, Union
 
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator
 
 from dicomsync.exceptions import NoSettingsFoundError
 from dicomsync.local import DICOMRootFolder, ZippedDICOMRootFolder
@@ -21,6 +23,16 @@ SerializablePlace = (Union)[
 class DicomSyncSettings(BaseModel):
     places: Dict[str, SerializablePlace]
 
+    @field_validator("places")
+    @classmethod
+    def intern_place_keys(cls, places):
+        """Place keys are compared and looked up often. Intern them once on load"""
+        return {sys.intern(key): place for key, place in places.items()}
+
+    def place_keys(self) -> List[str]:
+        """Keys of all places, in the order they were added"""
+        return list(self.places)
+
     def save(self):
         """Dummy save to be able to call save on any settings cli"""
         logger.debug("Save() called on non-file settings. Ignoring")
@@ -34,15 +46,17 @@ class DicomSyncSettingsFromFile(DicomSyncSettings):
     @classmethod
     def init_from_settings(cls, settings: DicomSyncSettings, path: Path):
         """Convert regular settings into settings from file by adding a path"""
-        return cls(**settings.dict(), path=path)
+        # pass places as-is. Dumping to dict first would validate each place again
+        return cls(places=settings.places, path=path)
 
     @classmethod
     def init_from_file(cls, file: Path):
         """Load settings from file"""
         try:
-            return cls.init_from_settings(
-                settings=DicomSyncSettings.parse_file(file), path=file
-            )
+            with open(file, "rb") as f:
+                # model_validate_json parses bytes with pydantic-core, no decode to str
+                settings = DicomSyncSettings.model_validate_json(f.read())
+            return cls.init_from_settings(settings=settings, path=file)
         except FileNotFoundError as e:
             raise NoSettingsFoundError(f"No settings file found at '{file}'") from e
 
@@ -52,6 +66,15 @@ class DicomSyncSettingsFromFile(DicomSyncSettings):
         return folder / DEFAULT_SETTINGS_FILE_NAME
 
     def save(self):
-        with open(self.path, "w") as f:
-            # persist super as we don't want to write path into the file
-            f.write(super().model_dump_json(indent=2))
+        """Write to a temporary file first and then replace the settings file. This
+        way an interrupted save never leaves a half-written settings file
+        """
+        temp_path = self.path.with_name(self.path.name + ".tmp")
+        try:
+            with open(temp_path, "w") as f:
+                # don't write path into the file, it is where the file is
+                f.write(self.model_dump_json(indent=2, exclude={"path"}))
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+        os.replace(temp_path, self.path)
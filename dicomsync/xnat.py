@@ -1,10 +1,11 @@
-"""Handles imaging studies in XNAT servers"""
+"""Handles imaging studies in XNAT servers
+
+The xnat library is imported only when a connection is made. It is slow to import
+and not needed for just loading or saving settings
+"""
 import os
 from contextlib import contextmanager
-from typing import Any, List, Literal, Optional
-
-import xnat
-from xnat.exceptions import XNATUploadError
+from typing import Any, Iterable, List, Literal, Optional
 
 from dicomsync.core import (
     AssertionResult,
@@ -50,6 +51,8 @@ class XNATUploadedStudy(ImagingStudy):
     This confusion is part of the reason for creating this library
     """
 
+    __slots__ = ()
+
     def __init__(self, subject: Subject, description: str):
         super().__init__(subject, description)
 
@@ -77,6 +80,8 @@ class XNATConnectionFactory:
 
     @contextmanager
     def get_connection(self):
+        import xnat
+
         with xnat.connect(
             server=self.server,
             user=self.user,
@@ -119,7 +124,7 @@ class XNATProjectPreArchive(Place):
         StudyNotFoundError
             If study for key is not there
         """
-        study = next((x for x in self.all_studies() if x.key == key), None)
+        study = next((x for x in self.all_studies() if x.key() == key), None)
         if not study:
             raise StudyNotFoundError(f"Study '{key}' not found in {self}")
         return study
@@ -186,6 +191,11 @@ class XNATProjectPreArchive(Place):
         logger.info(f"Uploading to {self}: {zipped_study}")
         if self.contains(zipped_study):
             raise StudyAlreadyExistsError(f"Study {zipped_study} is already in {self}")
+        self._import_zipped_study(zipped_study)
+
+    def _import_zipped_study(self, zipped_study: ZippedDICOMStudy):
+        """Upload zipped study to pre-archive without checking for existence"""
+        from xnat.exceptions import XNATUploadError
 
         logger.info(f"Uploading {zipped_study}")
         try:
@@ -202,22 +212,40 @@ class XNATProjectPreArchive(Place):
 
     def assert_has_study(self, zipped_study: ZippedDICOMStudy) -> AssertionResult:
         """Make sure the zipped study is in XNAT. If not, upload"""
+        return self.assert_has_studies([zipped_study])[0]
 
-        previous_studies = self.imported_studies() + self.all_studies()
+    def assert_has_studies(
+        self, zipped_studies: Iterable[ZippedDICOMStudy]
+    ) -> List[AssertionResult]:
+        """Make sure each zipped study is in XNAT. Upload the ones that are not.
 
-        if zipped_study.key() in [x.key() for x in previous_studies]:
-            logger.info(f"Skipping Study {zipped_study} as it is already in {self}")
-            return AssertionResult(status=AssertionStatus.skipped)
-        else:
+        Lists the project and pre-archive only once for all studies, instead of
+        querying XNAT again for each study.
+        """
+        previous_keys = {x.key() for x in self.imported_studies()}
+        previous_keys.update(x.key() for x in self.all_studies())
+
+        results = []
+        for zipped_study in zipped_studies:
+            key = zipped_study.key()
+            if key in previous_keys:
+                logger.info(f"Skipping Study {zipped_study} as it is already in {self}")
+                results.append(AssertionResult(status=AssertionStatus.skipped))
+                continue
             try:
-                self.send_zipped_study(zipped_study)
-                return AssertionResult(
-                    status=AssertionStatus.created,
-                    message=f"created {zipped_study.key()}",
+                self._import_zipped_study(zipped_study)
+                previous_keys.add(key)
+                results.append(
+                    AssertionResult(
+                        status=AssertionStatus.created, message=f"created {key}"
+                    )
                 )
             except DICOMSyncError as e:
                 logger.warning(f"Skipping due to Error uploading '{zipped_study}': {e}")
-                return AssertionResult(status=AssertionStatus.error, message=str(e))
+                results.append(
+                    AssertionResult(status=AssertionStatus.error, message=str(e))
+                )
+        return results
 
 
 class SerializableXNATProjectPreArchive(Place):
@@ -246,6 +274,8 @@ class SerializableXNATProjectPreArchive(Place):
             If password could not be read when initializing connecting to pre_archive
         """
         if not self._pre_archive:
+            import xnat
+
             logger.debug("XNAT pre archive is not initialized yet. Connecting..")
             self._pre_archive = XNATProjectPreArchive(
                 connection=xnat.connect(
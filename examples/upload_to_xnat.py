@@ -43,5 +43,5 @@ logger.info(summarize_results(results))
 with session_factory.get_connection() as connection:
     project = XNATProjectPreArchive(connection=connection, project_name="myproject")
     logger.info(f"Sending to {project}")
-    results = [project.assert_has_study(study) for study in zip_folder.all_studies()]
+    results = project.assert_has_studies(zip_folder.all_studies())
     logger.info(summarize_results(results))
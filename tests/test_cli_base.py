@@ -0,0 +1,35 @@
+import click
+import pytest
+from click.testing import CliRunner
+
+from dicomsync.cli.base import DicomSyncGroup, get_key_for_place
+from dicomsync.exceptions import DICOMSyncError, PasswordNotFoundError
+from dicomsync.local import DICOMRootFolder
+
+
+def test_get_key_for_place(some_settings):
+    place_b = some_settings.places["placeB"]
+    assert get_key_for_place(place_b, some_settings) == "placeB"
+
+    # an equal place which is not the same object should also be found
+    equal_place = DICOMRootFolder(path=some_settings.places["placeA"].path)
+    assert get_key_for_place(equal_place, some_settings) == "placeA"
+
+    with pytest.raises(DICOMSyncError):
+        get_key_for_place(DICOMRootFolder(path="/unknown"), some_settings)
+
+
+def test_group_handles_password_error():
+    """Missing password is a user error. Should not show a stack trace"""
+
+    @click.group(cls=DicomSyncGroup)
+    def a_group():
+        pass
+
+    @a_group.command()
+    def a_command():
+        raise PasswordNotFoundError("XNAT_PASS not set")
+
+    response = CliRunner().invoke(a_group, args=["a-command"])
+    assert response.exit_code == 2
+    assert "XNAT_PASS not set" in response.output
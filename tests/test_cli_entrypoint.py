@@ -1,5 +1,7 @@
 """Test basic functionality of CLI"""
 import os
+import subprocess
+import sys
 from pathlib import Path
 
 from click.testing import CliRunner
@@ -45,3 +47,25 @@ def test_load_save_settings(tmpdir, some_settings, monkeypatch):
     assert response.exit_code == 0
     for x in ["placeA", "placeB", "placeC"]:
         assert x in response.stdout
+
+
+def test_lazy_subcommands():
+    """Subcommands are imported on demand but should still be listed"""
+    response = CliRunner().invoke(main, args=["--help"])
+    assert response.exit_code == 0
+    for command in ["place", "send", "status"]:
+        assert command in response.stdout
+
+
+def test_lazy_subcommand_not_imported():
+    """Running one subcommand should not import the others. Check in a fresh
+    interpreter, as other tests will have imported everything already
+    """
+    script = (
+        "import sys\n"
+        "from dicomsync.cli.entrypoint import main\n"
+        "main(['send', '--help'], standalone_mode=False)\n"
+        "assert 'dicomsync.cli.send' in sys.modules\n"
+        "assert 'dicomsync.cli.place' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", script], check=True, capture_output=True)
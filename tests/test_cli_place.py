@@ -72,3 +72,13 @@ def test_place_add_xnat_pre_archive(mock_settings, a_runner):
     assert places["key_3"].server == "server"
     assert places["key_3"].project == "project1"
     assert places["key_3"].user == "a_user"
+
+
+def test_place_ls(mock_settings, a_runner, a_dicom_root_folder):
+    mock_settings.settings.places["a_root"] = a_dicom_root_folder
+    response = a_runner.invoke(
+        main, args=["place", "ls", "a_root"], catch_exceptions=False
+    )
+    assert response.exit_code == 0
+    assert "patient1/study1" in response.stdout
+    assert "Found 1 studies over 1 patients" in response.stdout
@@ -1,8 +1,10 @@
 from pathlib import Path
 from unittest.mock import Mock
 
+import pytest
 from pytest import fixture
 
+from dicomsync.cli import base
 from dicomsync.cli.base import DicomSyncContext
 from dicomsync.cli.entrypoint import main
 from dicomsync.local import DICOMRootFolder, ZippedDICOMRootFolder
@@ -42,3 +44,43 @@ def test_save_load_to_local_dir(a_runner_with_settings):
     # a_folder/study does not exist, so exception
     assert "not found" in str(response.exception)
     assert response.exit_code == 1
+
+
+def test_send_place_key_with_slash(a_runner_with_settings, mock_settings):
+    """Place keys can contain '/'. Only patient and study parts are restricted"""
+    places = mock_settings.settings.places
+    places["site/a"] = places["a_folder"]
+    response = a_runner_with_settings.invoke(
+        main, args=["send", "site/a:patient/study", "a_pre_archive"]
+    )
+    assert "Expected format" not in response.output
+    assert "not found" in str(response.exception)
+
+
+@pytest.mark.parametrize(
+    "study",
+    [
+        "a_folder",
+        "a_folder:patient",
+        "a_folder:patient/study/extra",
+        "a_folder:patient/",
+        "a_folder:/study",
+    ],
+)
+def test_send_malformed_study(a_runner_with_settings, study):
+    response = a_runner_with_settings.invoke(main, args=["send", study, "a_folder"])
+    assert response.exit_code == 2
+    assert "Expected format" in response.output
+
+
+def test_settings_loaded_once(a_runner_with_settings, monkeypatch):
+    """Both place arguments and the command itself should share a single settings
+    load
+    """
+    load_settings = Mock(wraps=base.load_settings)
+    monkeypatch.setattr(base, "load_settings", load_settings)
+
+    a_runner_with_settings.invoke(
+        main, args=["send", "a_folder:patient/study", "a_pre_archive"]
+    )
+    assert load_settings.call_count == 1
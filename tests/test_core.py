@@ -1,6 +1,11 @@
+import copy
+import pickle
+
 import pytest
+from slugify import slugify
 
 from dicomsync.core import ImagingStudyIdentifier, Subject, make_slug
+from dicomsync.exceptions import DICOMSyncError
 
 
 @pytest.mark.parametrize("string_in", ["oneword", "an_underscore", "", "234gffj4"])
@@ -15,6 +20,15 @@ def test_ensure_slug_fail(string_in):
     assert not make_slug(string_in) == string_in
 
 
+@pytest.mark.parametrize(
+    "string_in",
+    ["a space", "_Leading.dots..", "a--b__c", "--", "Patiënt ß", "a'quote", "&amp;"],
+)
+def test_make_slug_same_as_slugify(string_in):
+    """The fast path for simple ascii strings should not change results"""
+    assert make_slug(string_in) == slugify(string_in, separator="_", lowercase=True)
+
+
 def test_study_identifier():
 
     identifier = ImagingStudyIdentifier(
@@ -26,3 +40,35 @@ def test_study_identifier():
     assert recreated.place_name == "place1"
     assert recreated.patient.name == "patient1"
     assert recreated.study_key == "study1"
+
+    with_slash = ImagingStudyIdentifier.init_from_string("site/a:patient1/study1")
+    assert with_slash.place_name == "site/a"
+
+
+@pytest.mark.parametrize(
+    "string_in",
+    [
+        "place1",
+        "place1:patient1",
+        "",
+        "patient/1",
+        "place1:patient1/study/1",
+        "place1:patient:1/study1",
+    ],
+)
+def test_study_identifier_init_from_string_fail(string_in):
+    with pytest.raises(DICOMSyncError):
+        ImagingStudyIdentifier.init_from_string(string_in)
+
+
+def test_subject_pickle_copy():
+    subject = Subject("patient1")
+    assert pickle.loads(pickle.dumps(subject)) == subject
+    assert copy.deepcopy(subject) == subject
+    assert copy.copy(subject) == subject
+
+
+def test_subject_hashable():
+    subjects = {Subject("patient1"), Subject(name="patient1"), Subject("patient2")}
+    assert len(subjects) == 2
+    assert Subject("patient1") in subjects
@@ -1,9 +1,13 @@
 import logging
+import os
+import zipfile
 from pathlib import Path
 
+import pytest
 from pytest import fixture
 
 from dicomsync.core import Subject
+from dicomsync.exceptions import StudyNotFoundError
 from dicomsync.local import DICOMRootFolder, DICOMStudyFolder, ZippedDICOMRootFolder
 from tests.conftest import add_dummy_files
 from tests.factories import DICOMStudyFolderFactory
@@ -14,6 +18,18 @@ def some_dicom_folders():
     return [DICOMStudyFolderFactory() for _ in range(3)]
 
 
+def scandir_denied_for(folder_name):
+    """os.scandir that raises PermissionError for folders with this name"""
+    scandir = os.scandir
+
+    def mock_scandir(path):
+        if Path(path).name == folder_name:
+            raise PermissionError(f"Permission denied: '{path}'")
+        return scandir(path)
+
+    return mock_scandir
+
+
 @fixture()
 def an_empty_dicom_root_folder(tmpdir):
     """A dicom root folder with dummy data on disk"""
@@ -55,3 +71,142 @@ def test_zip(tmpdir, an_empty_zipfile_root_dir, caplog):
     assert zip_root.contains(study_folder)
     zipped_study = zip_root.all_studies()[0]
     assert zipped_study.description == "study_1"
+    with zipfile.ZipFile(zipped_study.path) as zip_file:
+        assert sorted(zip_file.namelist()) == sorted(
+            x.name for x in study_folder.all_files()
+        )
+        assert {x.compress_type for x in zip_file.infolist()} == {zipfile.ZIP_STORED}
+    assert [x.name for x in zipped_study.path.parent.iterdir()] == ["study_1.zip"]
+
+
+def test_zip_failure_leaves_no_file(tmpdir, an_empty_zipfile_root_dir):
+    study_folder = DICOMStudyFolderFactory(path=Path(tmpdir) / "a_study")
+    add_dummy_files(study_folder)
+    (study_folder.path / "dangling").symlink_to(Path(tmpdir) / "missing")
+
+    with pytest.raises(FileNotFoundError):
+        an_empty_zipfile_root_dir.send_dicom_folder(study_folder)
+    patient_folder = an_empty_zipfile_root_dir.path / study_folder.subject.name
+    assert list(patient_folder.iterdir()) == []
+
+
+def test_get_study(a_dicom_root_folder, a_dicom_zipped_folder):
+    for place in (a_dicom_root_folder, a_dicom_zipped_folder):
+        study = place.get_study("patient1/study1")
+        assert study.key() == "patient1/study1"
+        assert study.path.exists()
+        with pytest.raises(StudyNotFoundError):
+            place.get_study("patient1/unknown")
+
+
+def test_get_study_non_slug_folder(an_empty_dicom_root_folder):
+    """Folder names are not slugs. Study should still be found by slug key"""
+    (an_empty_dicom_root_folder.path / "Patient1" / "Study.1").mkdir(parents=True)
+
+    study = an_empty_dicom_root_folder.get_study("patient1/study_1")
+    assert study.description == "Study.1"
+    with pytest.raises(StudyNotFoundError):
+        an_empty_dicom_root_folder.get_study("Patient1/Study.1")
+
+
+def test_get_study_any_same_as_get_study(an_empty_dicom_root_folder):
+    """Two folders with the same slug key. Both lookups should return the first"""
+    for name in ("Study.1", "Study 1", "Study-1"):
+        (an_empty_dicom_root_folder.path / "Patient1" / name).mkdir(parents=True)
+    first = an_empty_dicom_root_folder.all_studies()[0]
+
+    assert an_empty_dicom_root_folder.get_study("patient1/study_1") is first
+    assert an_empty_dicom_root_folder.get_study_any(["patient1/study_1"]) is first
+
+
+def test_all_studies_cached(a_dicom_root_folder, tmpdir):
+    """Folder is only scanned once, until a study is sent here"""
+    assert len(a_dicom_root_folder.all_studies()) == 1
+    (a_dicom_root_folder.path / "patient2" / "study1").mkdir(parents=True)
+    assert len(a_dicom_root_folder.all_studies()) == 1
+
+    a_study = DICOMStudyFolderFactory(path=Path(tmpdir) / "a_study")
+    add_dummy_files(a_study)
+    a_dicom_root_folder.send_dicom_folder(a_study)
+    assert len(a_dicom_root_folder.all_studies()) == 3
+
+
+def test_contains_updated_after_send(a_dicom_root_folder, tmpdir):
+    a_study = DICOMStudyFolderFactory(path=Path(tmpdir) / "a_study")
+    add_dummy_files(a_study)
+    assert not a_dicom_root_folder.contains(a_study)
+
+    a_dicom_root_folder.send_dicom_folder(a_study)
+    assert a_dicom_root_folder.contains(a_study)
+
+
+def test_equality_ignores_cache(a_dicom_root_folder):
+    other = DICOMRootFolder(path=a_dicom_root_folder.path)
+    assert other == a_dicom_root_folder
+    a_dicom_root_folder.all_studies()
+    assert other == a_dicom_root_folder
+    other.all_studies()
+    assert other == a_dicom_root_folder
+    assert DICOMRootFolder(path="other") != a_dicom_root_folder
+
+
+def test_all_files_missing_folder(tmpdir, monkeypatch):
+    assert DICOMStudyFolderFactory(path=Path(tmpdir) / "missing").all_files() == []
+    a_file = Path(tmpdir) / "a_file"
+    a_file.write_text("not a folder")
+    assert DICOMStudyFolderFactory(path=a_file).all_files() == []
+
+    unreadable = Path(tmpdir) / "unreadable"
+    unreadable.mkdir()
+    monkeypatch.setattr(os, "scandir", scandir_denied_for("unreadable"))
+    assert DICOMStudyFolderFactory(path=unreadable).all_files() == []
+
+
+def test_all_studies_missing_root(an_empty_zipfile_root_dir):
+    assert not an_empty_zipfile_root_dir.path.exists()
+    assert an_empty_zipfile_root_dir.all_studies() == []
+
+
+def test_all_studies_root_is_file(tmpdir):
+    a_file = Path(tmpdir) / "a_file"
+    a_file.write_text("not a folder")
+    assert DICOMRootFolder(path=a_file).all_studies() == []
+
+
+def test_all_studies_unreadable_folder(a_dicom_root_folder, monkeypatch):
+    """An unreadable patient folder is skipped, not an error"""
+    (a_dicom_root_folder.path / "patient2" / "study1").mkdir(parents=True)
+    monkeypatch.setattr(os, "scandir", scandir_denied_for("patient2"))
+
+    assert [x.key() for x in a_dicom_root_folder.all_studies()] == ["patient1/study1"]
+
+
+def test_zipped_all_studies_root_is_file(tmpdir):
+    a_file = Path(tmpdir) / "a_file"
+    a_file.write_text("not a folder")
+    assert ZippedDICOMRootFolder(path=a_file).all_studies() == []
+
+
+def test_zipped_all_studies_unreadable_folder(a_dicom_zipped_folder, monkeypatch):
+    """An unreadable patient folder is skipped, not an error"""
+    (a_dicom_zipped_folder.path / "patient2").mkdir()
+    monkeypatch.setattr(os, "scandir", scandir_denied_for("patient2"))
+
+    assert [x.key() for x in a_dicom_zipped_folder.all_studies()] == ["patient1/study1"]
+
+
+@pytest.mark.parametrize("key", ["patient1/", "/patient1", "patient1/study1/x"])
+def test_get_study_malformed_key(a_dicom_root_folder, a_dicom_zipped_folder, key):
+    """Keys with an empty or extra part should never resolve to a folder"""
+    for place in (a_dicom_root_folder, a_dicom_zipped_folder):
+        with pytest.raises(StudyNotFoundError):
+            place.get_study(key)
+        with pytest.raises(StudyNotFoundError):
+            place.get_study_any([key])
+
+
+def test_get_study_any(a_dicom_root_folder):
+    study = a_dicom_root_folder.get_study_any(["patient1/unknown", "patient1/study1"])
+    assert study.key() == "patient1/study1"
+    with pytest.raises(StudyNotFoundError):
+        a_dicom_root_folder.get_study_any(["patient1/unknown", "patient2/study1"])
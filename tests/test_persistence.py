@@ -1,5 +1,10 @@
+import json
+from pathlib import Path
+
+import pytest
+
 from dicomsync.local import ZippedDICOMRootFolder
-from dicomsync.persistence import DicomSyncSettings
+from dicomsync.persistence import DicomSyncSettings, DicomSyncSettingsFromFile
 
 
 def test_save_load_settings(some_settings):
@@ -19,3 +24,34 @@ def test_child_model_loading():
     loaded = DicomSyncSettings.model_validate_json(dump)
 
     assert loaded.places["place1"] == settings.places["place1"]
+
+
+def test_load_place_without_type():
+    """Older or hand-written settings might not have type_. Should still load"""
+    loaded = DicomSyncSettings.model_validate_json('{"places": {"a": {"path": "/x"}}}')
+    assert loaded.places["a"].path == Path("/x")
+
+
+def test_save_settings_to_file(some_settings, tmpdir):
+    path = Path(tmpdir) / "settings.json"
+    DicomSyncSettingsFromFile.init_from_settings(some_settings, path=path).save()
+
+    assert path.exists()
+    assert not path.with_name("settings.json.tmp").exists()
+    assert "path" not in json.loads(path.read_text())  # path is not saved in file
+    loaded = DicomSyncSettingsFromFile.init_from_file(path)
+    assert list(loaded.places) == list(some_settings.places)
+
+
+def test_save_settings_failure_leaves_no_file(some_settings, tmpdir, monkeypatch):
+    path = Path(tmpdir) / "settings.json"
+    settings = DicomSyncSettingsFromFile.init_from_settings(some_settings, path=path)
+
+    def fail(*args, **kwargs):
+        raise ValueError("serialization failed")
+
+    monkeypatch.setattr(DicomSyncSettingsFromFile, "model_dump_json", fail)
+    with pytest.raises(ValueError):
+        settings.save()
+    assert not path.exists()
+    assert not path.with_name("settings.json.tmp").exists()
@@ -1,11 +1,15 @@
 """Test uploading local files to an xnat server"""
 from pathlib import Path
+from unittest.mock import MagicMock, Mock
 
+import pytest
 from _pytest.fixtures import fixture
 
-from dicomsync.core import Subject
+from dicomsync.core import AssertionStatus, Subject
+from dicomsync.exceptions import StudyNotFoundError
 from dicomsync.local import DICOMRootFolder, DICOMStudyFolder
-from tests.factories import DICOMStudyFolderFactory
+from dicomsync.xnat import XNATProjectPreArchive
+from tests.factories import DICOMStudyFolderFactory, ZippedDICOMStudyFactory
 from tests.conftest import add_dummy_files
 
 
@@ -32,3 +36,38 @@ def test_basic_upload(tmpdir):
         subject=Subject(name="subject1"), description="study_1", path=a_dicom_folder
     )
     assert study_folder
+
+
+def test_pre_archive_get_study():
+    uploaded = Mock(subject="patient1")
+    uploaded.name = "study1"  # name is a Mock() constructor arg
+    connection = MagicMock()
+    connection.prearchive.sessions.return_value = [uploaded]
+    project = XNATProjectPreArchive(connection=connection, project_name="project")
+
+    assert project.get_study("patient1/study1").key() == "patient1/study1"
+    with pytest.raises(StudyNotFoundError):
+        project.get_study("patient1/unknown")
+
+
+def test_assert_has_studies():
+    """Checking many studies should list the XNAT pre-archive only once"""
+    studies = [ZippedDICOMStudyFactory() for _ in range(3)]
+    uploaded = Mock(subject=studies[0].subject.name)
+    uploaded.name = studies[0].description  # name is a Mock() constructor arg
+
+    connection = MagicMock()
+    connection.prearchive.sessions.return_value = [uploaded]
+    connection.projects.__getitem__.return_value.subjects.tabulate.return_value = []
+    connection.projects.__getitem__.return_value.experiments.tabulate.return_value = []
+    project = XNATProjectPreArchive(connection=connection, project_name="project")
+
+    results = project.assert_has_studies(studies)
+
+    assert [x.status for x in results] == [
+        AssertionStatus.skipped,
+        AssertionStatus.created,
+        AssertionStatus.created,
+    ]
+    assert connection.prearchive.sessions.call_count == 1
+    assert connection.services.import_.call_count == 2